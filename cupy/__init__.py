@@ -185,6 +185,7 @@ from numpy import complex128  # NOQA
 # -----------------------------------------------------------------------------
 from cupy._creation.basic import empty  # NOQA
 from cupy._creation.basic import empty_like  # NOQA
+from cupy._creation.basic import empty_many  # NOQA
 from cupy._creation.basic import eye  # NOQA
 from cupy._creation.basic import full  # NOQA
 from cupy._creation.basic import full_like  # NOQA
@@ -193,6 +194,7 @@ from cupy._creation.basic import ones  # NOQA
 from cupy._creation.basic import ones_like  # NOQA
 from cupy._creation.basic import zeros  # NOQA
 from cupy._creation.basic import zeros_like  # NOQA
+from cupy._creation.basic import zeros_overwritten  # NOQA
 
 from cupy._creation.from_data import copy  # NOQA
 from cupy._creation.from_data import array  # NOQA
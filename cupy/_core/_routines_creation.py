@@ -0,0 +1,53 @@
+import numpy
+
+from cupy import _core
+
+
+# Below this size a fill kernel launches faster than cudaMemsetAsync;
+# above it the memset's DMA-engine bandwidth wins.
+_MEMSET_THRESHOLD = 64 * 1024
+
+_full_fill_kernel = _core.ElementwiseKernel(
+    'T v', 'T out', 'out = v', 'cupy_full_fill')
+
+
+def fill_scalar(a, fill_value):
+    """Fills ``a`` with a host scalar in a single kernel launch.
+
+    The scalar is cast to ``a.dtype`` on the host (with unsafe casting,
+    matching ``copyto(..., casting='unsafe')``) so no broadcasting or
+    casting machinery runs on the device. Values whose byte pattern is a
+    single repeated byte (0, -1 for ints, True, ...) are routed through
+    ``cudaMemsetAsync`` when the array is large and contiguous; the
+    runtime only exposes the byte-wise memset, so wider patterns such as
+    1.0f keep the fill kernel.
+    """
+    v = numpy.asarray(fill_value).astype(a.dtype, casting='unsafe')[()]
+    raw = v.tobytes()
+    if raw == raw[:1] * len(raw) and a.nbytes >= _MEMSET_THRESHOLD:
+        flags = a.flags
+        if flags.c_contiguous or flags.f_contiguous:
+            a.data.memset_async(raw[0], a.nbytes)
+            return
+    _full_fill_kernel(v, a)
+
+
+def fill_device_scalar(a, fill_value):
+    """Fills ``a`` from a 0-d device array of the same dtype.
+
+    The scalar is read by the fill kernel itself, so no host
+    synchronization and none of ``copyto``'s dispatch is involved.
+    """
+    _full_fill_kernel(fill_value, a)
+
+
+def full_filled(shape, dtype, fill_value, order='C'):
+    """Allocates a new array and fills it with a host scalar.
+
+    This is the fused fast path behind :func:`cupy.ones` and
+    :func:`cupy.full`: one pool allocation followed by one fill kernel,
+    with no intermediate ``copyto`` dispatch.
+    """
+    a = _core.ndarray(shape, dtype, order=order)
+    fill_scalar(a, fill_value)
+    return a
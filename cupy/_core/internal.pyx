@@ -486,9 +486,13 @@ cpdef strides_t _get_strides_for_order_K(x, dtype, shape=None):
     stride_and_index.sort()
     strides.resize(x.ndim)
     stride = dtype.itemsize
+    # Hoist the shape fallback out of the loop; an explicit accumulation
+    # loop over the (small) ndim beats any itertools-based variant here.
+    if shape is None:
+        shape = x.shape
     for s, i in stride_and_index:
         strides[-i] = stride
-        stride *= shape[-i] if shape else x.shape[-i]
+        stride *= shape[-i]
     return strides
 
 
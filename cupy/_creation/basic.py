@@ -1,14 +1,159 @@
+import collections
+import functools
+import operator
+import os
+import threading
 from typing import Any, Optional
 
 import numpy
 
 import cupy
+from cupy import _core
+from cupy._core import _routines_creation
+from cupy._core import internal
 from cupy._core.internal import _get_strides_for_order_K, _update_order_char
 from cupy.typing._types import (
     _OrderKACF, _OrderCF, _ShapeLike, DTypeLike, NDArray,
 )
 
 
+# Module-level aliases so the allocation hot paths pay a single fast
+# global load instead of a LOAD_GLOBAL + LOAD_ATTR pair per call.
+# ``cupy.copyto`` cannot be aliased here: it is bound in cupy/__init__
+# only after this module is imported.
+_ndarray = _core.ndarray
+_np_dtype = numpy.dtype
+_isscalar = numpy.isscalar
+_cuda_alloc = cupy.cuda.alloc
+_is_hip = cupy.cuda.runtime.is_hip
+
+
+# Below this size, launching a small fill kernel is cheaper than
+# ``cudaMemsetAsync`` and avoids memset nodes in CUDA graph capture.
+# Above it the memset's bandwidth advantage wins.
+_MEMSET_THRESHOLD = _routines_creation._MEMSET_THRESHOLD
+
+_zero_fill_kernel = _core.ElementwiseKernel(
+    '', 'T out', 'out = 0', 'cupy_zero_fill')
+
+# Pre-resolved dtypes for the common Python scalar types, to avoid
+# allocating a transient 0-d array in ``numpy.array(fill_value).dtype``
+# on every ``full()`` call. ``int`` is resolved through NumPy once at
+# import so the platform-default integer dtype is used.
+_scalar_dtypes = {
+    bool: _np_dtype(numpy.bool_),
+    int: numpy.array(0).dtype,
+    float: _np_dtype(numpy.float64),
+    complex: _np_dtype(numpy.complex128),
+}
+_int_dtype_min = numpy.iinfo(_scalar_dtypes[int]).min
+_int_dtype_max = numpy.iinfo(_scalar_dtypes[int]).max
+
+
+def _infer_scalar_dtype(fill_value):
+    dtype = _scalar_dtypes.get(type(fill_value))
+    if dtype is not None:
+        if dtype.kind != 'i' or _int_dtype_min <= fill_value <= _int_dtype_max:
+            return dtype
+    elif isinstance(fill_value, numpy.generic):
+        return fill_value.dtype
+    # Out-of-range ints and exotic scalar types take the generic path.
+    return numpy.array(fill_value).dtype
+
+
+class _ZeroCache:
+    """Per-device LRU cache of pool-owned zero-filled blocks.
+
+    For sizes where ``cudaMemsetAsync`` launch overhead still matters
+    but the fill kernel no longer wins, ``zeros()`` clones one of these
+    blocks with a single device-to-device copy instead. The cached
+    blocks are never handed out, only copied from, so they stay zero by
+    construction.
+
+    Each block carries an event that is recorded after its initial
+    memset and re-recorded after every outbound copy; hitting streams
+    wait on it before copying, and eviction synchronizes on it before
+    the pointer is released, so the pool never reuses a block with a
+    copy still in flight on another stream. All state is mutated under
+    a lock, like CuPy's other call-time caches.
+    """
+
+    max_item_nbytes = 256 * 1024
+    _max_total_nbytes = 4 * 1024 * 1024
+
+    def __init__(self):
+        # {(device_id, nbytes): (MemoryPointer, Event)}, LRU order
+        self._blocks = collections.OrderedDict()
+        self._total = 0
+        self._lock = threading.Lock()
+
+    def fill(self, data, nbytes):
+        stream = cupy.cuda.get_current_stream()
+        if not _is_hip and stream.is_capturing():
+            # During stream capture the cache's memset and event
+            # operations would be recorded as graph nodes instead of
+            # executed, seeding the cache with never-zeroed blocks and
+            # breaking capture isolation. A plain memset node captures
+            # cleanly. (Capture is not supported on HIP, where even
+            # querying the capture status raises.)
+            data.memset_async(0, nbytes)
+            return
+        key = (cupy.cuda.device.get_device_id(), nbytes)
+        with self._lock:
+            cached = self._blocks.get(key)
+            if cached is None:
+                data.memset_async(0, nbytes)
+                self._insert(key, nbytes)
+                return
+            self._blocks.move_to_end(key)
+            memptr, event = cached
+            stream.wait_event(event)
+            data.copy_from_device_async(memptr, nbytes)
+            event.record(stream)
+
+    def _insert(self, key, nbytes):
+        # Caller must hold ``self._lock``.
+        memptr = _cuda_alloc(nbytes)
+        memptr.memset_async(0, nbytes)
+        event = cupy.cuda.Event(block=False, disable_timing=True)
+        event.record()
+        self._blocks[key] = (memptr, event)
+        self._total += nbytes
+        while self._total > self._max_total_nbytes:
+            evicted, (memptr, event) = self._blocks.popitem(last=False)
+            # The last outbound copy from this block may still be in
+            # flight on another stream; wait for it before the pointer
+            # goes back to the pool.
+            event.synchronize()
+            self._total -= evicted[1]
+
+
+_zero_cache = _ZeroCache()
+
+
+def _zero_fill(a):
+    # ``data`` and ``nbytes`` are read once here; both are property
+    # accesses crossing the extension boundary.
+    nbytes = a.nbytes
+    if nbytes < _MEMSET_THRESHOLD:
+        _zero_fill_kernel(a)
+    elif nbytes <= _ZeroCache.max_item_nbytes:
+        _zero_cache.fill(a.data, nbytes)
+    else:
+        a.data.memset_async(0, nbytes)
+
+
+@functools.lru_cache(maxsize=None)
+def _mk_empty(dtype, order):
+    # Emit a per-(dtype, order) constructor closure. ``dtype`` is a
+    # canonical numpy.dtype (hashable, interned by NumPy), so repeat
+    # calls with the same signature -- the common case in iterative
+    # workloads -- skip kwarg parsing and dtype normalization.
+    def _empty(shape):
+        return _ndarray(shape, dtype, order=order)
+    return _empty
+
+
 def empty(
         shape: _ShapeLike,
         dtype: DTypeLike = float,
@@ -28,7 +173,54 @@ def empty(
     .. seealso:: :func:`numpy.empty`
 
     """
-    return cupy.ndarray(shape, dtype, order=order)
+    return _mk_empty(_np_dtype(dtype), order)(shape)
+
+
+# Sub-array offsets inside an ``empty_many`` slab are aligned the same
+# way the memory pool aligns its blocks.
+_SLAB_ALIGNMENT = 512
+
+
+def empty_many(
+        shapes: Any,
+        dtype: DTypeLike = float,
+        order: _OrderCF = 'C',
+) -> list[NDArray[Any]]:
+    """Returns multiple arrays backed by a single allocation.
+
+    This is a batch variant of :func:`cupy.empty` specific to CuPy. All
+    returned arrays are views into one memory-pool block, so creating
+    ``n`` arrays costs a single pool lookup instead of ``n``. The block
+    is freed when the last of the arrays goes out of scope.
+
+    Args:
+        shapes (sequence of ints or tuples of ints): Dimensionalities of
+            the arrays.
+        dtype (data-type, optional): Data type specifier, shared by all
+            arrays.
+        order ({'C', 'F'}): Row-major (C-style) or column-major
+            (Fortran-style) order.
+
+    Returns:
+        list of cupy.ndarray: New arrays with elements not initialized.
+
+    .. seealso:: :func:`cupy.empty`
+
+    """
+    dtype = _np_dtype(dtype)
+    itemsize = dtype.itemsize
+    shapes = [(s,) if _isscalar(s) else tuple(s) for s in shapes]
+    offsets = []
+    total = 0
+    for shape in shapes:
+        offsets.append(total)
+        nbytes = internal.prod(shape) * itemsize
+        total += (
+            (nbytes + _SLAB_ALIGNMENT - 1) // _SLAB_ALIGNMENT
+            * _SLAB_ALIGNMENT)
+    memptr = _cuda_alloc(total)
+    return [_ndarray(shape, dtype, memptr + offset, order=order)
+            for shape, offset in zip(shapes, offsets)]
 
 
 def _new_like_order_and_strides(
@@ -37,29 +229,67 @@ def _new_like_order_and_strides(
     Determine order and strides as in NumPy's PyArray_NewLikeArray.
 
     (see: numpy/core/src/multiarray/ctors.c)
+
+    ``dtype`` must already be a ``numpy.dtype`` instance; callers
+    normalize it once so it is not re-normalized here and again in the
+    ndarray constructor.
+
+    The normalized shape is returned as the last tuple element so
+    callers do not renormalize it. Note that the fallback to the
+    prototype's shape tests ``shape is None``; an explicit ``()`` or
+    ``0`` is a valid shape override and must not be discarded for being
+    falsy.
     """
     order = order.upper()
     if order not in ['C', 'F', 'K', 'A']:
         raise ValueError('order not understood: {}'.format(order))
 
-    if numpy.isscalar(shape):
+    if shape is None:
+        shape = a.shape
+    elif _isscalar(shape):
         shape = (shape,)
 
     # Fallback to c_contiguous if keep order and number of dimensions
     # of new shape mismatch
-    if order == 'K' and shape is not None and len(shape) != a.ndim:
-        return 'C', None, None
+    if order == 'K' and len(shape) != a.ndim:
+        return 'C', None, None, shape
 
+    # Fetch the flags proxy once; each ``a.flags`` access synthesizes a
+    # fresh flags object.
+    flags = a.flags
     order = chr(_update_order_char(
-        a.flags.c_contiguous, a.flags.f_contiguous, ord(order)))
+        flags.c_contiguous, flags.f_contiguous, ord(order)))
+
+    # Note on order='F': an F-contiguous allocation of ``shape`` is
+    # byte-identical to a C-contiguous allocation of the reversed shape,
+    # so the fill kernels used by ones_like/zeros_like/full_like already
+    # write it in plain memory order; no transposed staging is needed.
 
     if order == 'K':
-        strides = _get_strides_for_order_K(a, numpy.dtype(dtype), shape)
+        strides = _get_strides_for_order_K(a, dtype, shape)
         order = 'C'
-        memptr = cupy.empty(a.size, dtype=dtype).data if get_memptr else None
-        return order, strides, memptr
+        # Allocate from the pool directly; wrapping the memory in a
+        # throwaway ndarray just to get its ``.data`` is pure overhead.
+        memptr = _cuda_alloc(a.size * dtype.itemsize) if get_memptr \
+            else None
+        return order, strides, memptr, shape
     else:
-        return order, None, None
+        return order, None, None, shape
+
+
+def _fast_like_alloc(a, dtype, order):
+    # Fast path for ``*_like`` calls without a shape override: when the
+    # result is plainly contiguous there is no need for the generic
+    # PyArray_NewLikeArray logic in ``_new_like_order_and_strides``.
+    if order == 'C' or order == 'F':
+        return _ndarray(a.shape, dtype, order=order)
+    if order == 'K':
+        flags = a.flags
+        if flags.c_contiguous:
+            return _ndarray(a.shape, dtype, order='C')
+        if flags.f_contiguous:
+            return _ndarray(a.shape, dtype, order='F')
+    return None
 
 
 def empty_like(
@@ -97,11 +327,28 @@ def empty_like(
         raise TypeError('subok is not supported yet')
     if dtype is None:
         dtype = prototype.dtype
+    else:
+        dtype = _np_dtype(dtype)
+    if shape is None:
+        out = _fast_like_alloc(prototype, dtype, order)
+        if out is not None:
+            return out
 
-    order, strides, memptr = _new_like_order_and_strides(
+    order, strides, memptr, shape = _new_like_order_and_strides(
         prototype, dtype, order, shape)
-    shape = shape if shape else prototype.shape
-    return cupy.ndarray(shape, dtype, memptr, strides, order)
+    return _ndarray(shape, dtype, memptr, strides, order)
+
+
+# ``out`` is raw so the index math stays in logical (row, col) space
+# even when the output is F-ordered; ``out[i]`` resolves strides itself.
+_eye_kernel = _core.ElementwiseKernel(
+    'int64 m, int64 k', 'raw T out',
+    '''
+    ptrdiff_t row = i / m;
+    ptrdiff_t col = i % m;
+    out[i] = (col - row == k) ? T(1) : T(0);
+    ''',
+    'cupy_eye')
 
 
 def eye(
@@ -132,10 +379,17 @@ def eye(
     """
     if M is None:
         M = N
-    ret = zeros((N, M), dtype=dtype, order=order)
     if k <= -N or k >= M:
-        return ret
-    ret.diagonal(k).fill(1)
+        # No diagonal to write; this also keeps arbitrary-precision
+        # Python offsets away from the kernel's int64 parameter.
+        return zeros((N, M), dtype=dtype, order=order)
+    # Reject fractional offsets as the diagonal() view used to, instead
+    # of letting the kernel parameter conversion truncate them.
+    k = operator.index(k)
+    # A single fused kernel writes both the zeros and the diagonal,
+    # instead of a memset followed by a strided fill on a diagonal view.
+    ret = _ndarray((N, M), dtype, order=order)
+    _eye_kernel(M, k, ret, size=ret.size)
     return ret
 
 
@@ -154,7 +408,11 @@ def identity(n: int, dtype: DTypeLike = float) -> NDArray[Any]:
     .. seealso:: :func:`numpy.identity`
 
     """
-    return eye(n, dtype=dtype)
+    # Call the fused eye kernel directly with k=0; going through eye()
+    # would only add its M/order argument handling on top.
+    ret = _ndarray((n, n), dtype)
+    _eye_kernel(n, 0, ret, size=ret.size)
+    return ret
 
 
 def ones(
@@ -178,9 +436,7 @@ def ones(
     .. seealso:: :func:`numpy.ones`
 
     """
-    a = cupy.ndarray(shape, dtype, order=order)
-    a.fill(1)
-    return a
+    return _routines_creation.full_filled(shape, dtype, 1, order)
 
 
 def ones_like(
@@ -217,12 +473,18 @@ def ones_like(
         raise TypeError('subok is not supported yet')
     if dtype is None:
         dtype = a.dtype
-
-    order, strides, memptr = _new_like_order_and_strides(a, dtype, order,
-                                                         shape)
-    shape = shape if shape else a.shape
-    a = cupy.ndarray(shape, dtype, memptr, strides, order)
-    a.fill(1)
+    else:
+        dtype = _np_dtype(dtype)
+    if shape is None:
+        out = _fast_like_alloc(a, dtype, order)
+        if out is not None:
+            _routines_creation.fill_scalar(out, 1)
+            return out
+
+    order, strides, memptr, shape = _new_like_order_and_strides(
+        a, dtype, order, shape)
+    a = _ndarray(shape, dtype, memptr, strides, order)
+    _routines_creation.fill_scalar(a, 1)
     return a
 
 
@@ -242,11 +504,56 @@ def zeros(
     Returns:
         cupy.ndarray: An array filled with zeros.
 
+    .. note::
+        If every element of the array is overwritten before being read
+        (e.g. ``a = cupy.zeros(...); a[:] = f(...)``), the zero fill is
+        wasted work and adds a launch (or a CUDA graph node) per call;
+        use :func:`cupy.empty` or :func:`cupy.zeros_overwritten` for
+        that pattern.
+
     .. seealso:: :func:`numpy.zeros`
 
     """
-    a = cupy.ndarray(shape, dtype, order=order)
-    a.data.memset_async(0, a.nbytes)
+    a = _mk_empty(_np_dtype(dtype), order)(shape)
+    _zero_fill(a)
+    return a
+
+
+def zeros_overwritten(
+        shape: _ShapeLike,
+        dtype: DTypeLike = float,
+        order: _OrderCF = 'C',
+) -> NDArray[Any]:
+    """Returns an uninitialized array for callers that fully overwrite it.
+
+    This is a CUDA-graph-friendly variant of :func:`cupy.zeros` for the
+    ``a = cupy.zeros(...); a[:] = ...`` pattern: the zero fill is
+    skipped, so no memset kernel is launched and no memset node appears
+    in CUDA graph capture. The caller must write every element before
+    reading any.
+
+    If the environment variable ``CUPY_DEBUG_ZEROS_OVERWRITTEN`` is set
+    to ``1``, the array is instead filled with a nonzero poison pattern
+    so that code relying on zero initialization fails visibly.
+
+    Args:
+        shape (int or tuple of ints): Dimensionalities of the array.
+        dtype (data-type, optional): Data type specifier.
+        order ({'C', 'F'}): Row-major (C-style) or column-major
+            (Fortran-style) order.
+
+    Returns:
+        cupy.ndarray: A new array with elements not initialized.
+
+    .. seealso:: :func:`cupy.zeros`, :func:`cupy.empty`
+
+    """
+    a = _ndarray(shape, dtype, order=order)
+    # Read at call time so the debug mode is testable and can be
+    # toggled without reimporting CuPy; this path is off the hot loop
+    # by design, so the lookup cost is irrelevant.
+    if os.environ.get('CUPY_DEBUG_ZEROS_OVERWRITTEN', '0') == '1':
+        a.data.memset_async(0xCC, a.nbytes)
     return a
 
 
@@ -284,15 +591,37 @@ def zeros_like(
         raise TypeError('subok is not supported yet')
     if dtype is None:
         dtype = a.dtype
-
-    order, strides, memptr = _new_like_order_and_strides(a, dtype, order,
-                                                         shape)
-    shape = shape if shape else a.shape
-    a = cupy.ndarray(shape, dtype, memptr, strides, order)
-    a.data.memset_async(0, a.nbytes)
+    else:
+        dtype = _np_dtype(dtype)
+    if shape is None:
+        out = _fast_like_alloc(a, dtype, order)
+        if out is not None:
+            _zero_fill(out)
+            return out
+
+    order, strides, memptr, shape = _new_like_order_and_strides(
+        a, dtype, order, shape)
+    a = _ndarray(shape, dtype, memptr, strides, order)
+    _zero_fill(a)
     return a
 
 
+def _fill_new_array(a, fill_value):
+    # Python scalars and 0-d NumPy arrays take the single-kernel scalar
+    # fill. A 0-d cupy.ndarray of matching dtype is fed to the fill
+    # kernel directly, so its value is read on the device without
+    # synchronizing to the host. Everything else (arrays that need
+    # broadcasting or casting) goes through copyto.
+    if _isscalar(fill_value) or (
+            isinstance(fill_value, numpy.ndarray) and fill_value.ndim == 0):
+        _routines_creation.fill_scalar(a, fill_value)
+    elif (isinstance(fill_value, cupy.ndarray) and fill_value.ndim == 0
+            and fill_value.dtype == a.dtype):
+        _routines_creation.fill_device_scalar(a, fill_value)
+    else:
+        cupy.copyto(a, fill_value, casting='unsafe')
+
+
 def full(
         shape: _ShapeLike,
         fill_value: Any,
@@ -320,9 +649,9 @@ def full(
         if isinstance(fill_value, cupy.ndarray):
             dtype = fill_value.dtype
         else:
-            dtype = numpy.array(fill_value).dtype
-    a = cupy.ndarray(shape, dtype, order=order)
-    cupy.copyto(a, fill_value, casting='unsafe')
+            dtype = _infer_scalar_dtype(fill_value)
+    a = _ndarray(shape, dtype, order=order)
+    _fill_new_array(a, fill_value)
     return a
 
 
@@ -362,10 +691,16 @@ def full_like(
         raise TypeError('subok is not supported yet')
     if dtype is None:
         dtype = a.dtype
-
-    order, strides, memptr = _new_like_order_and_strides(a, dtype, order,
-                                                         shape)
-    shape = shape if shape else a.shape
-    a = cupy.ndarray(shape, dtype, memptr, strides, order)
-    cupy.copyto(a, fill_value, casting='unsafe')
+    else:
+        dtype = _np_dtype(dtype)
+    if shape is None:
+        out = _fast_like_alloc(a, dtype, order)
+        if out is not None:
+            _fill_new_array(out, fill_value)
+            return out
+
+    order, strides, memptr, shape = _new_like_order_and_strides(
+        a, dtype, order, shape)
+    a = _ndarray(shape, dtype, memptr, strides, order)
+    _fill_new_array(a, fill_value)
     return a
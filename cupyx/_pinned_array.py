@@ -75,10 +75,11 @@ def empty_like_pinned(a, dtype=None, order='K', subok=None, shape=None):
         raise TypeError('subok is not supported yet')
     if dtype is None:
         dtype = a.dtype
-    shape = _update_shape(a, shape)
-    order, strides, _ = _new_like_order_and_strides(
+    else:
+        dtype = numpy.dtype(dtype)
+    order, strides, _, shape = _new_like_order_and_strides(
         a, dtype, order, shape, get_memptr=False)
-    nbytes = internal.prod(shape) * numpy.dtype(dtype).itemsize
+    nbytes = internal.prod(shape) * dtype.itemsize
     mem = cuda.alloc_pinned_memory(nbytes)
     out = numpy.ndarray(shape, dtype=dtype, buffer=mem,
                         strides=strides, order=order)
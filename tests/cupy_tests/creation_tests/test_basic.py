@@ -178,6 +178,11 @@ class TestBasic:
     def test_eye(self, xp, dtype, order, offset):
         return xp.eye(5, 4, offset, dtype, order=order)
 
+    def test_eye_invalid_offset(self):
+        for xp in (numpy, cupy):
+            with pytest.raises(TypeError):
+                xp.eye(5, k=0.5)
+
     @testing.for_all_dtypes()
     @testing.numpy_cupy_array_equal()
     def test_identity(self, xp, dtype):
@@ -265,6 +270,21 @@ class TestBasic:
             return xp.full(
                 (2, 3, 4), numpy.array(1, dtype=dtype1), dtype=dtype2)
 
+    # The following shapes exceed the 64 KiB threshold above which
+    # repeated-byte fill values dispatch to cudaMemsetAsync; the int32
+    # case (bytes 01 00 00 00) must keep the fill kernel.
+    @testing.numpy_cupy_array_equal()
+    def test_ones_large_repeated_byte(self, xp):
+        return xp.ones((70000,), dtype=numpy.uint8)
+
+    @testing.numpy_cupy_array_equal()
+    def test_full_large_repeated_byte(self, xp):
+        return xp.full((70000,), -1, dtype=numpy.int8)
+
+    @testing.numpy_cupy_array_equal()
+    def test_full_large_non_repeated_byte(self, xp):
+        return xp.full((70000,), 1, dtype=numpy.int32)
+
     @testing.for_orders('CFAK')
     @testing.for_all_dtypes()
     @testing.numpy_cupy_array_equal()
@@ -286,6 +306,123 @@ class TestBasic:
             cupy.full_like(a, 1, subok=True)
 
 
+class TestEmptyMany:
+
+    @testing.for_CF_orders()
+    @testing.for_all_dtypes()
+    def test_empty_many(self, dtype, order):
+        arrays = cupy.empty_many([(2, 3, 4), 3, ()], dtype=dtype,
+                                 order=order)
+        assert [a.shape for a in arrays] == [(2, 3, 4), (3,), ()]
+        for i, a in enumerate(arrays):
+            assert a.dtype == numpy.dtype(dtype)
+            a.fill(i)
+        # Arrays must not overlap even though they share one allocation.
+        for i, a in enumerate(arrays):
+            testing.assert_array_equal(a, cupy.full(a.shape, i, dtype=dtype))
+
+    def test_empty_many_no_shapes(self):
+        assert cupy.empty_many([]) == []
+
+
+class TestZerosOverwritten:
+
+    @testing.for_CF_orders()
+    @testing.for_all_dtypes()
+    def test_zeros_overwritten(self, dtype, order):
+        a = cupy.zeros_overwritten((2, 3, 4), dtype=dtype, order=order)
+        assert a.shape == (2, 3, 4)
+        assert a.dtype == numpy.dtype(dtype)
+        if order in ['f', 'F']:
+            assert a.flags.f_contiguous
+        else:
+            assert a.flags.c_contiguous
+        a.fill(1)
+        testing.assert_array_equal(a, cupy.ones((2, 3, 4), dtype=dtype))
+
+    def test_zeros_overwritten_poison(self, monkeypatch):
+        monkeypatch.setenv('CUPY_DEBUG_ZEROS_OVERWRITTEN', '1')
+        a = cupy.zeros_overwritten(16, dtype=numpy.uint8)
+        testing.assert_array_equal(
+            a, cupy.full(16, 0xCC, dtype=numpy.uint8))
+
+
+class TestZerosFillDispatch:
+    # zeros() dispatches on nbytes: a fill kernel below 64 KiB, a
+    # cached zero-block clone up to 256 KiB, and cudaMemsetAsync above.
+    # Cover each band and the sizes straddling the thresholds.
+
+    @pytest.mark.parametrize('nbytes', [
+        256,
+        64 * 1024 - 1,
+        64 * 1024,
+        128 * 1024,
+        256 * 1024,
+        256 * 1024 + 1,
+        512 * 1024,
+    ])
+    def test_zeros_bands(self, nbytes):
+        a = cupy.zeros(nbytes, dtype=numpy.uint8)
+        assert (a == 0).all()
+        # Dirty the first array; a second request of the same size (the
+        # cache-hit path in the middle band) must be independent of it
+        # and still come back all-zero.
+        a.fill(1)
+        b = cupy.zeros(nbytes, dtype=numpy.uint8)
+        assert (b == 0).all()
+
+    def test_zeros_cache_eviction(self):
+        # More distinct cache-band sizes than the 4 MiB cap can hold,
+        # twice over: the first pass forces evictions, the second
+        # re-misses evicted sizes and re-inserts them.
+        sizes = range(64 * 1024, 256 * 1024 + 1, 8 * 1024)
+        for _ in range(2):
+            for size in sizes:
+                a = cupy.zeros(size, dtype=numpy.uint8)
+                assert (a == 0).all()
+                a.fill(1)
+
+
+@testing.parameterize(
+    *testing.product({
+        'shape': [(), 0],
+    })
+)
+class TestLikeFalsyShape:
+    # shape=() and shape=0 are falsy but valid overrides; they must not
+    # silently fall back to the prototype's shape.
+
+    @testing.with_requires('numpy>=1.17.0')
+    @testing.for_all_dtypes()
+    @testing.numpy_cupy_array_equal()
+    def test_empty_like_falsy_shape(self, xp, dtype):
+        a = testing.shaped_arange((2, 3, 4), xp, dtype)
+        b = xp.empty_like(a, shape=self.shape)
+        b.fill(0)
+        return b
+
+    @testing.with_requires('numpy>=1.17.0')
+    @testing.for_all_dtypes()
+    @testing.numpy_cupy_array_equal()
+    def test_zeros_like_falsy_shape(self, xp, dtype):
+        a = testing.shaped_arange((2, 3, 4), xp, dtype)
+        return xp.zeros_like(a, shape=self.shape)
+
+    @testing.with_requires('numpy>=1.17.0')
+    @testing.for_all_dtypes()
+    @testing.numpy_cupy_array_equal()
+    def test_ones_like_falsy_shape(self, xp, dtype):
+        a = testing.shaped_arange((2, 3, 4), xp, dtype)
+        return xp.ones_like(a, shape=self.shape)
+
+    @testing.with_requires('numpy>=1.17.0')
+    @testing.for_all_dtypes()
+    @testing.numpy_cupy_array_equal()
+    def test_full_like_falsy_shape(self, xp, dtype):
+        a = testing.shaped_arange((2, 3, 4), xp, dtype)
+        return xp.full_like(a, 1, shape=self.shape)
+
+
 @testing.parameterize(
     *testing.product({
         'shape': [4, (4, ), (4, 2), (4, 2, 3), (5, 4, 2, 3)],